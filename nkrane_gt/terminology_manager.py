@@ -1,20 +1,81 @@
 # nkrane_gt/terminology_manager.py
 import os
 import csv
+import json
 import re
+import sys
 import spacy
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, List, Tuple, Optional, Set
+from spacy.lang.en.stop_words import STOP_WORDS as STOPWORDS
+from spacy.matcher import PhraseMatcher
+from spacy.tokens import Doc
 from dataclasses import dataclass
 
-# Load spaCy model for English
+# Bump when the layout or meaning of the terms cache sidecar changes
+TERMS_CACHE_VERSION = 3
+
+# Below this average text length, nlp.pipe() multiprocessing is slower than
+# parsing in a single process
+MULTIPROCESS_MIN_AVG_LENGTH = 200
+
+# Placeholders inserted by preprocess_text, e.g. "<0>"
+PLACEHOLDER_PATTERN = re.compile(r'<\d+>')
+
+# Optional multi-keyword matcher, used to spot terms when spaCy is unavailable
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional memory-mapped CSV reader for large terminology files
 try:
-    nlp = spacy.load("en_core_web_sm")
-    STOPWORDS = nlp.Defaults.stop_words
-    SPACY_AVAILABLE = True
-except:
-    print("Warning: spaCy model not found. Please install: python -m spacy download en_core_web_sm")
-    SPACY_AVAILABLE = False
-    STOPWORDS = set()
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """
+    Load the spaCy English model once per process, on first use.
+
+    Only the tagger, attribute_ruler (which sets token.pos_, needed by
+    noun_chunks) and parser are used, so the rest of the pipeline is skipped.
+
+    Returns:
+        The loaded pipeline, or None if the model is not installed
+    """
+    try:
+        return spacy.load("en_core_web_sm", disable=["ner", "lemmatizer"])
+    except Exception:
+        print("Warning: spaCy model not found. Please install: python -m spacy download en_core_web_sm")
+        return None
+
+def __getattr__(name):
+    """Keep the old `nlp` and `SPACY_AVAILABLE` module globals working, now loaded lazily."""
+    if name == 'nlp':
+        return _get_nlp()
+    if name == 'SPACY_AVAILABLE':
+        return _get_nlp() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _lower_preserving_offsets(text: str) -> str:
+    """
+    Lowercase text without changing its length, so offsets found in the
+    result can be used to slice the original.
+
+    str.lower() can lengthen a string ('İ' becomes two characters); when it
+    does, those characters are left as they are.
+    """
+    text_lower = text.lower()
+    if len(text_lower) == len(text):
+        return text_lower
+    return ''.join(char if len(char.lower()) != 1 else char.lower() for char in text)
 
 @dataclass
 class Term:
@@ -23,16 +84,22 @@ class Term:
     source: str  # 'user'
 
 class TerminologyManager:
-    def __init__(self, target_lang: str, user_csv_path: str = None):
+    def __init__(self, target_lang: str, user_csv_path: str = None, use_cache: bool = True):
         """
         Initialize terminology manager.
 
         Args:
             target_lang: Target language code (ak, ee, gaa)
             user_csv_path: Path to user's CSV file (optional)
+            use_cache: Reuse (and write) a '<csv>.cache.json' sidecar holding the
+                parsed terms, so later runs can skip parsing an unchanged CSV
         """
         self.target_lang = target_lang
+        self.use_cache = use_cache
         self.terms = {}  # Dictionary: english_term -> translation
+        self._terms_nostop = {}  # Dictionary: english_term without stopwords -> english_term
+        self._automaton = None  # Aho-Corasick automaton over the terms (fallback only)
+        self._matcher = None  # spaCy PhraseMatcher over the terms
         self.csv_provided = False
 
         # Load user terms
@@ -41,148 +108,429 @@ class TerminologyManager:
         else:
             print("ℹ️  No terminology CSV provided. Translation will be direct without term substitution.")
 
+    @classmethod
+    def prewarm(cls) -> bool:
+        """
+        Load the spaCy model now instead of on first use, e.g. in a parent
+        process before forking workers so they share the loaded pipeline.
+
+        Returns:
+            True if the spaCy model is available
+        """
+        return _get_nlp() is not None
+
     def _load_user_terms(self, csv_path: str):
-        """Load user terms from CSV file."""
+        """Load user terms from CSV file, or from its cache sidecar if still current."""
         try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                # Try to detect the delimiter
-                sample = f.read(1024)
-                f.seek(0)
-
-                # Check for common delimiters
-                if ',' in sample:
-                    delimiter = ','
-                elif ';' in sample:
-                    delimiter = ';'
-                elif '\t' in sample:
-                    delimiter = '\t'
-                else:
-                    delimiter = ','  # default
-
-                reader = csv.DictReader(f, delimiter=delimiter)
-                fieldnames = [f.lower() for f in reader.fieldnames] if reader.fieldnames else []
-
-                # Determine which columns to use
-                text_col = None
-                trans_col = None
-
-                # Look for text column
-                for col in ['text', 'english', 'source', 'term', 'word']:
-                    if col in fieldnames:
-                        text_col = col
-                        break
-
-                # Look for translation column
-                for col in ['text_translated', 'translation', 'target', 'translated']:
-                    if col in fieldnames:
-                        trans_col = col
-                        break
-
-                # If not found, use first two columns
-                if not text_col or not trans_col:
-                    if len(fieldnames) >= 2:
-                        text_col = reader.fieldnames[0]
-                        trans_col = reader.fieldnames[1]
-                    else:
-                        print(f"❌ Error: CSV needs at least 2 columns")
-                        return
-
-                # Read terms
-                user_terms_count = 0
-                for row in reader:
-                    english_term = row.get(text_col, '').strip().lower()
-                    translation = row.get(trans_col, '').strip()
-
-                    if english_term and translation:
-                        self.terms[english_term] = translation
-                        user_terms_count += 1
-
-                self.csv_provided = True
-                print(f"✅ Loaded {user_terms_count} terms from {csv_path}")
+            cache_key = self._terms_cache_key(csv_path)
+            cached = self._read_terms_cache(csv_path, cache_key) if self.use_cache else None
+
+            if cached is not None:
+                user_terms, terms_nostop = cached
+            else:
+                user_terms = self._read_user_terms(csv_path)
+                if user_terms is None:
+                    return
+
+                # Also index terms by their stopword-free form, which is what
+                # noun phrase extraction produces, so matching is a dict lookup.
+                # Terms starting or ending with a stopword ("the station") are
+                # left out: the chunk's own leading/trailing stopwords are kept
+                # around the placeholder, so they would appear twice.
+                terms_nostop = {}
+                for english_term in user_terms:
+                    stripped = self._remove_stopwords(english_term)
+                    if not stripped or stripped == english_term:
+                        continue
+                    words = english_term.split()
+                    if not self._remove_stopwords(words[0]) or not self._remove_stopwords(words[-1]):
+                        continue
+                    terms_nostop.setdefault(stripped, english_term)
+
+                if self.use_cache:
+                    self._write_terms_cache(csv_path, cache_key, user_terms, terms_nostop)
+
+            self.terms.update(user_terms)
+            for stripped, english_term in terms_nostop.items():
+                self._terms_nostop.setdefault(stripped, english_term)
+
+            if _get_nlp() is not None:
+                self._build_matcher()
+            elif AHOCORASICK_AVAILABLE:
+                self._build_automaton()
+            user_terms_count = len(user_terms)
+            self.csv_provided = True
+            print(f"✅ Loaded {user_terms_count} terms from {csv_path}")
 
         except FileNotFoundError:
             print(f"❌ Error: CSV file not found at '{csv_path}'")
         except Exception as e:
             print(f"❌ Error loading user CSV: {e}")
 
+    def _read_user_terms(self, csv_path: str) -> Optional[Dict[str, str]]:
+        """
+        Parse the user's CSV file.
+
+        Returns:
+            Dictionary of english_term -> translation, or None if the CSV is unusable
+        """
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            # Try to detect the delimiter
+            sample = f.read(1024)
+            f.seek(0)
+
+            # Check for common delimiters
+            if ',' in sample:
+                delimiter = ','
+            elif ';' in sample:
+                delimiter = ';'
+            elif '\t' in sample:
+                delimiter = '\t'
+            else:
+                delimiter = ','  # default
+
+            # Plain csv.reader keeps each row as a list, so only the two
+            # columns we need are touched instead of building a dict per row
+            reader = csv.reader(f, delimiter=delimiter)
+            fieldnames = [name.lower() for name in next(reader, [])]
+
+            # Determine which columns to use
+            text_col = None
+            trans_col = None
+
+            # Look for text column
+            for col in ['text', 'english', 'source', 'term', 'word']:
+                if col in fieldnames:
+                    text_col = fieldnames.index(col)
+                    break
+
+            # Look for translation column
+            for col in ['text_translated', 'translation', 'target', 'translated']:
+                if col in fieldnames:
+                    trans_col = fieldnames.index(col)
+                    break
+
+            # If not found, use first two columns
+            if text_col is None or trans_col is None:
+                if len(fieldnames) >= 2:
+                    text_col = 0
+                    trans_col = 1
+                else:
+                    print(f"❌ Error: CSV needs at least 2 columns")
+                    return None
+
+            # Read terms, pulling both columns out of each row in one call
+            pairs = None
+            if PYARROW_AVAILABLE:
+                pairs = self._read_term_columns_arrow(
+                    csv_path, delimiter, len(fieldnames), text_col, trans_col
+                )
+            if pairs is None:
+                get_columns = itemgetter(text_col, trans_col)
+                min_width = max(text_col, trans_col) + 1
+                pairs = (get_columns(row) for row in reader if len(row) >= min_width)
+
+            user_terms = {}
+            for english_term, translation in pairs:
+                english_term = english_term.strip().lower()
+                translation = translation.strip()
+
+                if english_term and translation:
+                    # Interning shares one copy of strings that repeat
+                    # across rows, e.g. the same translation for synonyms
+                    user_terms[sys.intern(english_term)] = sys.intern(translation)
+
+            return user_terms
+
+    def _terms_cache_key(self, csv_path: str) -> Dict:
+        """Describe the CSV and environment that a cached parse is only valid for."""
+        stat = os.stat(csv_path)
+        return {
+            'version': TERMS_CACHE_VERSION,
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            # Stopword stripping depends on whether the spaCy model is present
+            # and on the stopword list shipped with this spaCy version
+            'spacy': _get_nlp() is not None,
+            'spacy_version': spacy.__version__,
+            # The CSV reader in use decides how unusual rows are parsed
+            'pyarrow': PYARROW_AVAILABLE
+        }
+
+    def _read_terms_cache(self, csv_path: str, cache_key: Dict) -> Optional[Tuple[Dict[str, str], Dict[str, str]]]:
+        """
+        Read the cache sidecar for a CSV file.
+
+        Returns:
+            Tuple of (terms, terms_nostop), or None if there is no up-to-date cache
+        """
+        try:
+            with open(csv_path + '.cache.json', 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(cache, dict) or cache.get('key') != cache_key:
+            return None
+
+        # A damaged payload is treated like a missing cache, so the CSV is parsed again
+        terms = cache.get('terms')
+        terms_nostop = cache.get('terms_nostop')
+        if not isinstance(terms, dict) or not isinstance(terms_nostop, dict):
+            return None
+        if not all(isinstance(term, str) and isinstance(translation, str)
+                   for term, translation in terms.items()):
+            return None
+        if not all(isinstance(stripped, str) and english_term in terms
+                   for stripped, english_term in terms_nostop.items()):
+            return None
+
+        terms = {sys.intern(term): sys.intern(translation)
+                 for term, translation in terms.items()}
+        return terms, terms_nostop
+
+    def _write_terms_cache(self, csv_path: str, cache_key: Dict,
+                           terms: Dict[str, str], terms_nostop: Dict[str, str]):
+        """Write the cache sidecar for a CSV file. Failing to write is not an error."""
+        cache = {'key': cache_key, 'terms': terms, 'terms_nostop': terms_nostop}
+        try:
+            with open(csv_path + '.cache.json', 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except OSError:
+            pass
+
+    def _read_term_columns_arrow(self, csv_path: str, delimiter: str, num_columns: int,
+                                 text_col: int, trans_col: int):
+        """
+        Read the term and translation columns with pyarrow over a memory-mapped file.
+
+        Returns:
+            Iterable of (term, translation) pairs, or None if any row doesn't
+            have as many columns as the header. pyarrow can only skip such rows,
+            while csv.reader keeps every row that has both columns, so the
+            caller falls back to csv.reader to load the same terms.
+        """
+        ragged_rows = []
+
+        def on_invalid_row(row):
+            ragged_rows.append(row)
+            return 'skip'
+
+        # Name columns by position so a BOM or odd header text can't get in the way
+        column_names = [f'column_{i}' for i in range(num_columns)]
+        with pa.memory_map(csv_path, 'r') as source:
+            table = pacsv.read_csv(
+                source,
+                # Skip the header as a parsed record, not a physical line, since
+                # it may contain quoted newlines
+                read_options=pacsv.ReadOptions(column_names=column_names, skip_rows_after_names=1),
+                parse_options=pacsv.ParseOptions(
+                    delimiter=delimiter,
+                    newlines_in_values=True,  # like csv.reader, allow quoted newlines
+                    invalid_row_handler=on_invalid_row
+                ),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=[column_names[text_col], column_names[trans_col]],
+                    column_types={name: pa.string() for name in column_names}
+                )
+            )
+
+        if ragged_rows:
+            return None
+        return zip(table.column(0).to_pylist(), table.column(1).to_pylist())
+
+    def _build_matcher(self):
+        """
+        Build a PhraseMatcher over all loaded terms and their stopword-free forms.
+
+        A noun phrase's text is its content tokens joined with single spaces,
+        so a term can only match a phrase whose lowercased tokens are exactly
+        the term split on spaces. Terms are added word by word for that reason,
+        rather than re-tokenized.
+        """
+        nlp = _get_nlp()
+        matcher = PhraseMatcher(nlp.vocab)
+        patterns = []
+        for english_term in list(self.terms) + list(self._terms_nostop):
+            words = english_term.split(' ')
+            # Empty words (from repeated spaces) could only line up with tokens
+            # that contain spaces, and _find_sentences_with_terms never skips those
+            if all(words):
+                patterns.append(Doc(nlp.vocab, words=words))
+        matcher.add("TERM", patterns)
+        self._matcher = matcher
+
+    def _find_sentences_with_terms(self, doc, sent_starts: List[int]) -> Set[int]:
+        """
+        Find the sentences of a Doc that can contain a terminology match.
+
+        A phrase's content tokens are contiguous once stopwords are dropped, so
+        the matcher runs over the document's lowercased non-stopword tokens.
+        That way no sentence the noun phrase matching would match is missed.
+
+        Returns:
+            Indexes (into doc.sents) of the candidate sentences
+        """
+        content = [token for token in doc if not token.is_stop]
+        candidates = set()
+
+        # Tokens containing spaces can't be expressed as matcher patterns
+        for token in content:
+            if ' ' in token.lower_:
+                candidates.add(bisect_right(sent_starts, token.i) - 1)
+
+        content_doc = Doc(doc.vocab, words=[token.lower_ for token in content])
+        for _, start, _ in self._matcher(content_doc):
+            candidates.add(bisect_right(sent_starts, content[start].i) - 1)
+
+        return candidates
+
+    def _build_automaton(self):
+        """Build an Aho-Corasick automaton over all loaded terms."""
+        automaton = ahocorasick.Automaton()
+        for english_term in self.terms:
+            automaton.add_word(english_term, english_term)
+        automaton.make_automaton()
+        self._automaton = automaton
+
+    def _match_terms_automaton(self, text: str, text_lower: str = None) -> List[Dict]:
+        """Find terms in text with a single Aho-Corasick pass, keeping leftmost-longest hits."""
+        if text_lower is None:
+            text_lower = _lower_preserving_offsets(text)
+        length = len(text_lower)
+
+        candidates = []
+        for end, english_term in self._automaton.iter(text_lower):
+            start = end - len(english_term) + 1
+            end += 1
+            # Only keep hits that start and end on word boundaries
+            if start > 0 and (text_lower[start - 1].isalnum() or text_lower[start - 1] == '_'):
+                continue
+            if end < length and (text_lower[end].isalnum() or text_lower[end] == '_'):
+                continue
+            candidates.append((start, end, english_term))
+
+        # Resolve overlaps: earliest start wins, then the longest term
+        candidates.sort(key=lambda c: (c[0], c[0] - c[1]))
+        result = []
+        last_end = 0
+        for start, end, english_term in candidates:
+            if start < last_end:
+                continue
+            result.append({
+                'text': english_term,
+                'text_lower': english_term,
+                'chunk_start': start,
+                'chunk_end': end,
+                'start': start,
+                'end': end,
+                'leading_stopwords': '',
+                'trailing_stopwords': ''
+            })
+            last_end = end
+        return result
+
     def _remove_stopwords(self, phrase: str) -> str:
         """Remove stopwords from a phrase."""
-        if not SPACY_AVAILABLE:
+        nlp = _get_nlp()
+        if nlp is None:
             # Simple fallback
             words = phrase.lower().split()
             filtered_words = [w for w in words if w not in STOPWORDS]
             return ' '.join(filtered_words)
 
-        doc = nlp(phrase.lower())
+        # is_stop is a lexical attribute, so the tokenizer alone is enough
+        doc = nlp.tokenizer(phrase.lower())
         cleaned_tokens = [token.text for token in doc if not token.is_stop]
         return ' '.join(cleaned_tokens).strip()
 
-    def _extract_noun_phrases(self, text: str) -> List[Dict]:
-        """Extract noun phrases from text using spaCy, filtering stopwords."""
-        if not SPACY_AVAILABLE:
-            # Fallback: extract words that are in our dictionary
-            words = re.findall(r'\b\w+\b', text.lower())
+    def _find_matching_term(self, phrase_lower: str) -> Optional[str]:
+        """
+        Find the terminology entry matching an already lowercased phrase.
+
+        Returns:
+            The matching key in self.terms, or None if there is no match
+        """
+        # Try exact match with content words
+        if phrase_lower in self.terms:
+            return phrase_lower
+
+        # Try terms whose stopwords were stripped at load time
+        return self._terms_nostop.get(phrase_lower)
+
+    def _extract_noun_phrases(self, text: str, text_lower: str = None) -> List[Dict]:
+        """
+        Extract noun phrases from text using spaCy, filtering stopwords.
+
+        Args:
+            text: Input text
+            text_lower: _lower_preserving_offsets(text), if the caller already
+                has it (fallback only)
+        """
+        nlp = _get_nlp()
+        if nlp is None:
+            if text_lower is None:
+                text_lower = _lower_preserving_offsets(text)
+
+            if self._automaton is not None:
+                return self._match_terms_automaton(text, text_lower)
+
+            # Fallback: extract words that are in our dictionary, taking
+            # each word's position straight from the match
             result = []
-            for word in words:
+            for match in re.finditer(r'\b\w+\b', text_lower):
+                word = match.group()
                 if word in self.terms:
-                    # Find position in original text
-                    start = text.lower().find(word)
-                    if start != -1:
-                        result.append({
-                            'text': word,
-                            'chunk_start': start,
-                            'chunk_end': start + len(word),
-                            'start': start,
-                            'end': start + len(word),
-                            'leading_stopwords': '',
-                            'trailing_stopwords': ''
-                        })
+                    result.append({
+                        'text': word,
+                        'text_lower': word,
+                        'chunk_start': match.start(),
+                        'chunk_end': match.end(),
+                        'start': match.start(),
+                        'end': match.end(),
+                        'leading_stopwords': '',
+                        'trailing_stopwords': ''
+                    })
             return result
 
-        doc = nlp(text)
+        return self._extract_noun_phrases_from_doc(nlp(text))
+
+    def _extract_noun_phrases_from_doc(self, doc) -> List[Dict]:
+        """Extract noun phrases from an already parsed spaCy Doc, filtering stopwords."""
         noun_phrases = []
 
         # Extract noun chunks and filter stopwords
         for chunk in doc.noun_chunks:
             # Get all tokens in this chunk
-            tokens = [token for token in chunk]
-
-            # Check if ALL tokens are stopwords - if so, skip this chunk entirely
-            if all(token.is_stop for token in tokens):
-                continue
+            tokens = list(chunk)
 
-            # Filter out stopwords to get content words
-            content_tokens = [token for token in tokens if not token.is_stop]
+            # Positions of the content (non-stopword) tokens within the chunk,
+            # checking each token's is_stop only once
+            content_positions = [i for i, token in enumerate(tokens) if not token.is_stop]
 
-            # If no content words left (shouldn't happen due to check above, but safety)
-            if not content_tokens:
+            # Skip chunks made up entirely of stopwords
+            if not content_positions:
                 continue
 
+            content_tokens = [tokens[i] for i in content_positions]
+
             # Get the text of content words only
             content_text = ' '.join(token.text for token in content_tokens)
+            # Lowercased once here from the tokens, for term lookup
+            content_lower = ' '.join(token.lower_ for token in content_tokens)
 
             # Calculate start and end positions for content words only
             first_content = content_tokens[0]
             last_content = content_tokens[-1]
-            
-            # Extract leading stopwords (between chunk start and first content word)
-            leading_stopwords = []
-            for token in tokens:
-                if token.idx < first_content.idx:
-                    leading_stopwords.append(token.text_with_ws)
-                else:
-                    break
-            
-            # Extract trailing stopwords (between last content word and chunk end)
-            trailing_stopwords = []
-            for token in reversed(tokens):
-                if token.idx > last_content.idx:
-                    trailing_stopwords.insert(0, token.text_with_ws)
-                else:
-                    break
+
+            # Leading stopwords are the tokens before the first content word,
+            # trailing stopwords the tokens after the last one
+            leading_stopwords = [token.text_with_ws for token in tokens[:content_positions[0]]]
+            trailing_stopwords = [token.text_with_ws for token in tokens[content_positions[-1] + 1:]]
 
             noun_phrases.append({
                 'text': content_text,  # Only content words, no stopwords
+                'text_lower': content_lower,  # Lowercased content words, for matching
                 'full_text': chunk.text,  # Original full phrase with stopwords
                 'chunk_start': chunk.start_char,  # Start of the entire chunk (including leading stopwords)
                 'chunk_end': chunk.end_char,  # End of the entire chunk (including trailing stopwords)
@@ -210,14 +558,66 @@ class TerminologyManager:
             # No terms to substitute
             return text, {}, {}
 
+        nlp = _get_nlp()
+        return self._preprocess(text, nlp(text) if nlp is not None else None)
+
+    def preprocess_texts(self, texts: List[str], batch_size: int = 64,
+                         n_process: int = 1) -> List[Tuple[str, Dict[str, str], Dict[str, str]]]:
+        """
+        Replace terminology with placeholders in a batch of texts.
+
+        Texts are parsed together with nlp.pipe(), which is considerably faster
+        than calling preprocess_text() on each one.
+
+        Args:
+            texts: Input texts
+            batch_size: Number of texts spaCy buffers per batch
+            n_process: Number of processes for spaCy to use. Multiprocessing
+                rarely pays off for short texts, so this defaults to 1 and is
+                ignored (with a warning) when texts average under
+                MULTIPROCESS_MIN_AVG_LENGTH characters.
+
+        Returns:
+            List of (preprocessed_text, replacements_dict, original_cases_dict),
+            one per input text
+        """
+        texts = list(texts)
+        if not self.terms:
+            return [(text, {}, {}) for text in texts]
+
+        nlp = _get_nlp()
+        if nlp is None:
+            return [self._preprocess(text, None) for text in texts]
+
+        # Worker start-up and pickling Docs back to the parent outweigh the
+        # parallel parsing unless the texts are reasonably long
+        if n_process != 1 and texts:
+            avg_length = sum(len(text) for text in texts) / len(texts)
+            if avg_length < MULTIPROCESS_MIN_AVG_LENGTH:
+                print(f"⚠️  Texts average {avg_length:.0f} characters; "
+                      f"ignoring n_process={n_process} and parsing in a single process.")
+                n_process = 1
+
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        return [self._preprocess(text, doc) for text, doc in zip(texts, docs)]
+
+    def _preprocess(self, text: str, doc) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Replace terminology with placeholders, given the parsed Doc (None without spaCy)."""
         # Split into sentences to process separately
-        if SPACY_AVAILABLE:
-            doc = nlp(text)
-            sentences = [sent.text for sent in doc.sents]
-            sentence_spans = [(sent.start_char, sent.end_char) for sent in doc.sents]
+        if doc is not None:
+            sents = list(doc.sents)
+            sentences = [sent.text for sent in sents]
+            sentence_spans = [(sent.start_char, sent.end_char) for sent in sents]
+
+            # Only sentences where the matcher finds a term can produce a match,
+            # so noun phrase extraction is skipped for all the others
+            sents_with_terms = self._find_sentences_with_terms(doc, [sent.start for sent in sents])
         else:
-            # Simple sentence splitting
+            # Simple sentence splitting. Lowercasing never touches the
+            # punctuation and whitespace split on, so the lowercased sentences
+            # line up with the originals and the text is only lowered once.
             sentences = re.split(r'(?<=[.!?])\s+', text)
+            sentences_lower = re.split(r'(?<=[.!?])\s+', _lower_preserving_offsets(text))
             sentence_spans = []
 
         processed_sentences = []
@@ -225,75 +625,67 @@ class TerminologyManager:
         all_original_cases = {}
         placeholder_counter = 0  # Shared counter across all sentences
 
-        for sentence in sentences:
-            # Extract noun phrases from the sentence
-            noun_phrases = self._extract_noun_phrases(sentence)
+        for i, sentence in enumerate(sentences):
+            # Extract noun phrases from the sentence, reusing the existing parse
+            if doc is not None:
+                if i in sents_with_terms:
+                    noun_phrases = self._extract_noun_phrases_from_doc(sents[i].as_doc())
+                else:
+                    noun_phrases = []
+            else:
+                noun_phrases = self._extract_noun_phrases(sentence, sentences_lower[i])
 
-            # Find phrases that match our terminology (case-insensitive)
+            # Find phrases that match our terminology (case-insensitive),
+            # keeping the translation so it doesn't need looking up again
             matching_phrases = []
             for phrase in noun_phrases:
-                phrase_lower = phrase['text'].lower()
-                
-                # Try exact match with content words
-                if phrase_lower in self.terms:
-                    matching_phrases.append(phrase)
-                else:
-                    # Try without any remaining stopwords (should already be clean, but double-check)
-                    cleaned = self._remove_stopwords(phrase_lower)
-                    if cleaned and cleaned in self.terms:
-                        # Update the phrase info with cleaned version
-                        phrase_copy = phrase.copy()
-                        phrase_copy['text'] = cleaned
-                        matching_phrases.append(phrase_copy)
-
-            # Sort by position (end to start) to avoid replacement issues
-            matching_phrases.sort(key=lambda x: x.get('chunk_start', x['start']), reverse=True)
-
-            preprocessed_sentence = sentence
+                matched = self._find_matching_term(phrase['text_lower'])
+                if matched is None:
+                    continue
+
+                # The phrase keeps its original-case text for case preservation;
+                # the matched key is only needed to look up the translation
+                matching_phrases.append((phrase, self.terms[matched]))
+
+            # Sort by position so the sentence can be rebuilt in a single pass
+            matching_phrases.sort(key=lambda x: x[0].get('chunk_start', x[0]['start']))
+
+            edits = []
             sentence_replacements = {}
             sentence_original_cases = {}
 
-            for phrase in matching_phrases:
-                phrase_lower = phrase['text'].lower()
-                translation = self.terms.get(phrase_lower)
-
-                if translation:
-                    placeholder = f"<{placeholder_counter}>"
-                    placeholder_counter += 1
-
-                    # Get leading and trailing stopwords
-                    leading = phrase.get('leading_stopwords', '')
-                    trailing = phrase.get('trailing_stopwords', '')
-                    
-                    # Replace the ENTIRE chunk (from chunk_start to chunk_end)
-                    # with: leading_stopwords + placeholder + trailing_stopwords
-                    chunk_start_pos = phrase.get('chunk_start', phrase['start'])
-                    chunk_end_pos = phrase.get('chunk_end', phrase['end'])
-
-                    # Build the replacement: leading stopwords + placeholder + trailing stopwords
-                    replacement = leading + placeholder + trailing
-
-                    # Replace the entire chunk
-                    preprocessed_sentence = (
-                        preprocessed_sentence[:chunk_start_pos] + 
-                        replacement + 
-                        preprocessed_sentence[chunk_end_pos:]
-                    )
-
-                    sentence_replacements[placeholder] = translation
-                    # Store both the content words and the full phrase for case preservation
-                    sentence_original_cases[placeholder] = {
-                        'content': phrase['text'],  # Just "station"
-                        'full': phrase.get('full_text', phrase['text']),  # "the station"
-                        'leading': leading  # "the "
-                    }
-
-            processed_sentences.append(preprocessed_sentence)
+            for phrase, translation in matching_phrases:
+                placeholder = f"<{placeholder_counter}>"
+                placeholder_counter += 1
+
+                # Get leading and trailing stopwords
+                leading = phrase.get('leading_stopwords', '')
+                trailing = phrase.get('trailing_stopwords', '')
+                
+                # Replace the ENTIRE chunk (from chunk_start to chunk_end)
+                # with: leading_stopwords + placeholder + trailing_stopwords
+                chunk_start_pos = phrase.get('chunk_start', phrase['start'])
+                chunk_end_pos = phrase.get('chunk_end', phrase['end'])
+
+                # Build the replacement: leading stopwords + placeholder + trailing stopwords
+                replacement = leading + placeholder + trailing
+
+                edits.append((chunk_start_pos, chunk_end_pos, replacement))
+
+                sentence_replacements[placeholder] = translation
+                # Store both the content words and the full phrase for case preservation
+                sentence_original_cases[placeholder] = {
+                    'content': phrase['text'],  # Just "station"
+                    'full': phrase.get('full_text', phrase['text']),  # "the station"
+                    'leading': leading  # "the "
+                }
+
+            processed_sentences.append(self._apply_replacements(sentence, edits))
             all_replacements.update(sentence_replacements)
             all_original_cases.update(sentence_original_cases)
 
         # Reconstruct text with processed sentences
-        if SPACY_AVAILABLE:
+        if doc is not None:
             # Join preserving original structure
             preprocessed_text = ''.join(
                 processed_sentences[i] + (text[sentence_spans[i][1]:sentence_spans[i+1][0]] if i < len(sentence_spans) - 1 else '')
@@ -307,6 +699,31 @@ class TerminologyManager:
 
         return preprocessed_text, all_replacements, all_original_cases
 
+    def _apply_replacements(self, text: str, edits: List[Tuple[int, int, str]]) -> str:
+        """
+        Splice replacements into text.
+
+        Args:
+            text: Text to edit
+            edits: Non-overlapping (start, end, replacement) triples, sorted by start
+
+        Returns:
+            Text with each [start:end] range replaced
+        """
+        # Collect the pieces and join once, rather than rebuilding the whole
+        # string for every edit
+        parts = []
+        cursor = 0
+        for start, end, replacement in edits:
+            if start < cursor:
+                # Overlaps the previous edit
+                continue
+            parts.append(text[cursor:start])
+            parts.append(replacement)
+            cursor = end
+        parts.append(text[cursor:])
+        return ''.join(parts)
+
     def postprocess_text(self, text: str, replacements: Dict[str, str], 
                         original_cases: Dict[str, str]) -> str:
         """
@@ -321,8 +738,8 @@ class TerminologyManager:
         Returns:
             Postprocessed text with actual translations
         """
-        result = text
-
+        # Work out the cased translation for each placeholder up front
+        cased = {}
         for placeholder, translation in replacements.items():
             case_info = original_cases.get(placeholder, '')
             
@@ -340,22 +757,6 @@ class TerminologyManager:
             # Determine the case to apply based on the full phrase (including leading stopword)
             original_to_check = original_full if original_full else original_content
             
-            # Find the placeholder in the text to check if it's at sentence start
-            import re
-            placeholder_pattern = re.escape(placeholder)
-            match = re.search(placeholder_pattern, result)
-            
-            is_sentence_start = False
-            if match:
-                pos = match.start()
-                if pos == 0:
-                    is_sentence_start = True
-                elif pos >= 2:
-                    # Check if preceded by sentence-ending punctuation + space
-                    preceding = result[max(0, pos-2):pos]
-                    if preceding in ['. ', '! ', '? ']:
-                        is_sentence_start = True
-            
             # Apply case based on the original phrase
             if original_to_check:
                 # Check if the leading stopword (if any) was capitalized
@@ -381,12 +782,24 @@ class TerminologyManager:
             else:
                 # Default to lowercase if no case info
                 translation = translation.lower()
-            
+
+            cased[placeholder] = translation
+
+        def substitute(match):
+            placeholder = match.group(0)
+            translation = cased.get(placeholder)
+            if translation is None:
+                return placeholder
+
             # If at sentence start, ensure first letter is capitalized (override previous logic)
+            pos = match.start()
+            is_sentence_start = pos == 0 or (pos >= 2 and text[pos-2:pos] in ('. ', '! ', '? '))
             if is_sentence_start and len(translation) > 0:
                 translation = translation[0].upper() + translation[1:]
+            return translation
 
-            result = result.replace(placeholder, translation)
+        # Replace every placeholder in a single pass over the text
+        result = PLACEHOLDER_PATTERN.sub(substitute, text)
 
         # Final pass: ensure sentences start with capital letters
         result = self._ensure_sentence_capitalization(result)
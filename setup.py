@@ -55,6 +55,9 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=read_requirements(),
+    extras_require={
+        'fast': ['pyahocorasick', 'pyarrow'],
+    },
     cmdclass={
         'install': PostInstallCommand,
     },
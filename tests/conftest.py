@@ -0,0 +1,91 @@
+import pytest
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+import nkrane_gt.terminology_manager as terminology_manager
+
+VERBS = {'saw', 'is', 'want', 'buy', 'said', 'like'}
+
+
+@Language.component("nkrane_test_parser")
+def nkrane_test_parser(doc):
+    """
+    Minimal stand-in for the en_core_web_sm tagger and parser.
+
+    Each sentence (split on . ! ?) is rooted at its first verb. Every maximal
+    run of non-verb, non-punctuation tokens becomes a noun phrase headed by
+    its last token, with the rest of the run attached to that head.
+    """
+    words = [token.text for token in doc]
+    spaces = [bool(token.whitespace_) for token in doc]
+    pos = [''] * len(doc)
+    heads = list(range(len(doc)))
+    deps = [''] * len(doc)
+
+    sentences, current = [], []
+    for token in doc:
+        current.append(token.i)
+        if token.text in '.!?':
+            sentences.append(current)
+            current = []
+    if current:
+        sentences.append(current)
+
+    for sentence in sentences:
+        runs, run = [], []
+        for i in sentence:
+            if doc[i].lower_ in VERBS or doc[i].is_punct:
+                if run:
+                    runs.append(run)
+                run = []
+            else:
+                run.append(i)
+        if run:
+            runs.append(run)
+
+        verbs = [i for i in sentence if doc[i].lower_ in VERBS]
+        root = verbs[0] if verbs else (runs[0][-1] if runs else sentence[0])
+
+        for i in sentence:
+            if doc[i].is_punct:
+                pos[i], deps[i] = 'PUNCT', 'punct'
+            elif doc[i].lower_ in VERBS:
+                pos[i], deps[i] = 'VERB', 'conj'
+            heads[i] = root
+        for run in runs:
+            head = run[-1]
+            pos[head] = 'PRON' if doc[head].lower_ == 'i' else 'NOUN'
+            deps[head] = 'nsubj' if head < root else 'dobj'
+            heads[head] = root
+            for i in run[:-1]:
+                pos[i], deps[i], heads[i] = 'ADJ', 'amod', head
+        deps[root] = 'ROOT'
+        heads[root] = root
+
+    return Doc(doc.vocab, words=words, spaces=spaces, pos=pos, heads=heads, deps=deps)
+
+
+@pytest.fixture
+def fake_nlp(monkeypatch):
+    """Patch the terminology manager to use the stand-in English pipeline."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("nkrane_test_parser")
+    monkeypatch.setattr(terminology_manager, '_get_nlp', lambda: nlp)
+    return nlp
+
+
+@pytest.fixture
+def no_nlp(monkeypatch):
+    """Patch the terminology manager to behave as if the spaCy model is missing."""
+    monkeypatch.setattr(terminology_manager, '_get_nlp', lambda: None)
+
+
+@pytest.fixture
+def write_csv(tmp_path):
+    """Write a terminology CSV into a temporary directory and return its path."""
+    def write(content, name='terms.csv'):
+        path = tmp_path / name
+        path.write_text(content, encoding='utf-8')
+        return str(path)
+    return write
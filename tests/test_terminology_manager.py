@@ -0,0 +1,213 @@
+import json
+
+import pytest
+
+from nkrane_gt.terminology_manager import TerminologyManager
+
+
+@pytest.mark.parametrize('term, text', [
+    ('big old house', "I saw the big very old house."),
+    ('big beautiful house', "I saw the big and beautiful house."),
+])
+def test_interior_stopword_chunk_matches_term(fake_nlp, write_csv, term, text):
+    csv_path = write_csv(f"term,translation\n{term},efie kese\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+
+    preprocessed, replacements, _ = manager.preprocess_text(text)
+
+    assert preprocessed == "I saw the <0>."
+    assert replacements == {'<0>': 'efie kese'}
+
+
+def test_sentence_without_terms_is_left_alone(fake_nlp, write_csv):
+    csv_path = write_csv("term,translation\nhouse,efie\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+
+    preprocessed, replacements, _ = manager.preprocess_text("I saw the car. I like the house.")
+
+    assert preprocessed == "I saw the car. I like the <0>."
+    assert replacements == {'<0>': 'efie'}
+
+
+@pytest.mark.parametrize('content', [
+    "term,translation\nhouse,efie,\ncar,kaa\n",
+    "term,translation,domain\nhouse,efie\ncar,kaa,general\n",
+    "term,translation\nhouse\ncar,kaa\n",
+    'term,translation\n"big\nhouse",efie kese\ncar,kaa\n',
+    '"te\nrm",translation\nhouse,efie\ncar,kaa\n',
+])
+def test_pyarrow_and_csv_loaders_agree_on_ragged_rows(no_nlp, write_csv, monkeypatch, content):
+    pytest.importorskip('pyarrow')
+    import nkrane_gt.terminology_manager as terminology_manager
+
+    csv_path = write_csv(content)
+    loaded = {}
+    for use_pyarrow in (True, False):
+        monkeypatch.setattr(terminology_manager, 'PYARROW_AVAILABLE', use_pyarrow)
+        loaded[use_pyarrow] = TerminologyManager('ak', csv_path, use_cache=False).terms
+
+    assert loaded[True] == loaded[False]
+    assert 'car' in loaded[True]
+
+
+def test_cache_sidecar_is_reused(no_nlp, write_csv):
+    csv_path = write_csv("term,translation\nhouse,efie\n")
+    TerminologyManager('ak', csv_path)
+
+    with open(csv_path + '.cache.json', 'r', encoding='utf-8') as f:
+        cache = json.load(f)
+    cache['terms']['car'] = 'kaa'
+    with open(csv_path + '.cache.json', 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+
+    assert TerminologyManager('ak', csv_path).terms == {'house': 'efie', 'car': 'kaa'}
+
+
+@pytest.mark.parametrize('damage', [
+    lambda cache: cache.pop('terms_nostop'),
+    lambda cache: cache.pop('terms'),
+    lambda cache: cache.update(terms=['house', 'efie']),
+    lambda cache: cache.update(terms={'house': 1}),
+    lambda cache: cache.update(terms_nostop={'house': 'missing term'}),
+])
+def test_damaged_cache_falls_back_to_parsing(no_nlp, write_csv, damage):
+    csv_path = write_csv("term,translation\nhouse,efie\n")
+    TerminologyManager('ak', csv_path)
+
+    with open(csv_path + '.cache.json', 'r', encoding='utf-8') as f:
+        cache = json.load(f)
+    damage(cache)
+    with open(csv_path + '.cache.json', 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+
+    manager = TerminologyManager('ak', csv_path)
+    assert manager.terms == {'house': 'efie'}
+    assert manager.csv_provided
+
+
+@pytest.mark.parametrize('use_automaton', [True, False])
+def test_fallback_offsets_survive_length_changing_lowercase(no_nlp, write_csv, monkeypatch, use_automaton):
+    import nkrane_gt.terminology_manager as terminology_manager
+
+    if use_automaton:
+        pytest.importorskip('ahocorasick')
+    monkeypatch.setattr(terminology_manager, 'AHOCORASICK_AVAILABLE', use_automaton)
+    csv_path = write_csv("term,translation\nhouse,efie\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+
+    preprocessed, replacements, original_cases = manager.preprocess_text("İİ house here.")
+
+    assert preprocessed == "İİ <0> here."
+    assert manager.postprocess_text(preprocessed, replacements, original_cases) == "İİ efie here."
+
+
+@pytest.mark.parametrize('as_generator', [False, True])
+def test_preprocess_texts_matches_preprocess_text(fake_nlp, write_csv, as_generator):
+    csv_path = write_csv("term,translation\nhouse,efie\ncar,kaa\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+    texts = ["I want the house.", "I saw the car. I like the house!", "Nothing here.", ""]
+
+    batch = manager.preprocess_texts((text for text in texts) if as_generator else texts, batch_size=2)
+
+    assert batch == [manager.preprocess_text(text) for text in texts]
+
+
+def test_preprocess_texts_parses_short_texts_in_one_process(fake_nlp, write_csv, monkeypatch):
+    csv_path = write_csv("term,translation\nhouse,efie\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+
+    pipe_calls = []
+    original_pipe = fake_nlp.pipe
+
+    def recording_pipe(texts, **kwargs):
+        pipe_calls.append(kwargs)
+        return original_pipe(texts, **kwargs)
+
+    monkeypatch.setattr(fake_nlp, 'pipe', recording_pipe)
+
+    results = manager.preprocess_texts(["I want the house."] * 3, n_process=2)
+
+    assert pipe_calls[0]['n_process'] == 1
+    assert results == [("I want the <0>.", {'<0>': 'efie'},
+                        {'<0>': {'content': 'house', 'full': 'the house', 'leading': 'the '}})] * 3
+
+
+@pytest.mark.parametrize('text, expected', [
+    ("I saw the Bank of Ghana.", "I saw the Ghana Sikakorabea."),
+    ("I saw BANK OF GHANA.", "I saw GHANA SIKAKORABEA."),
+    ("I saw the bank of ghana.", "I saw the ghana sikakorabea."),
+])
+def test_stopword_term_match_keeps_original_case(fake_nlp, write_csv, text, expected):
+    csv_path = write_csv("term,translation\nbank of ghana,ghana sikakorabea\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+
+    preprocessed, replacements, original_cases = manager.preprocess_text(text)
+
+    assert manager.postprocess_text(preprocessed, replacements, original_cases) == expected
+
+
+def test_term_starting_with_stopword_does_not_duplicate_it(fake_nlp, write_csv):
+    csv_path = write_csv("term,translation\nthe station,the station tr\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+
+    preprocessed, replacements, _ = manager.preprocess_text("I saw the station.")
+
+    assert preprocessed == "I saw the station."
+    assert replacements == {}
+
+
+def test_automaton_prefers_leftmost_longest_term(no_nlp, write_csv):
+    pytest.importorskip('ahocorasick')
+    csv_path = write_csv("term,translation\nhouse,efie\nbig house,efie kese\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+
+    preprocessed, replacements, _ = manager.preprocess_text("A big house and a house.")
+
+    assert preprocessed == "A <0> and a <1>."
+    assert replacements == {'<0>': 'efie kese', '<1>': 'efie'}
+
+
+def test_automaton_ignores_terms_inside_longer_words(no_nlp, write_csv):
+    pytest.importorskip('ahocorasick')
+    csv_path = write_csv("term,translation\ncar,kaa\n")
+    manager = TerminologyManager('ak', csv_path, use_cache=False)
+
+    preprocessed, replacements, _ = manager.preprocess_text("A cartoon, a scar and a car_x, not a car.")
+
+    assert preprocessed == "A cartoon, a scar and a car_x, not a <0>."
+    assert replacements == {'<0>': 'kaa'}
+
+
+def test_postprocess_capitalizes_each_placeholder_occurrence_by_position(no_nlp):
+    manager = TerminologyManager('ak')
+    original_cases = {'<0>': {'content': 'house', 'full': 'the house', 'leading': 'the '}}
+
+    result = manager.postprocess_text("<0> yɛ fɛ. Mepɛ <0> no. <0>!", {'<0>': 'efie'}, original_cases)
+
+    assert result == "Efie yɛ fɛ. Mepɛ efie no. Efie!"
+
+
+def test_postprocess_leaves_unknown_placeholders(no_nlp):
+    manager = TerminologyManager('ak')
+    original_cases = {'<0>': {'content': 'house', 'full': 'house', 'leading': ''}}
+
+    result = manager.postprocess_text("Mepɛ <0> ne <5>.", {'<0>': 'efie'}, original_cases)
+
+    assert result == "Mepɛ efie ne <5>."
+
+
+def test_legacy_spacy_globals_still_available(fake_nlp):
+    from nkrane_gt import terminology_manager
+    from nkrane_gt.terminology_manager import SPACY_AVAILABLE, nlp
+
+    assert SPACY_AVAILABLE is True
+    assert nlp is fake_nlp
+    with pytest.raises(AttributeError):
+        terminology_manager.not_a_real_attribute
+
+
+def test_legacy_spacy_available_without_model(no_nlp):
+    from nkrane_gt import terminology_manager
+
+    assert terminology_manager.SPACY_AVAILABLE is False
+    assert terminology_manager.nlp is None